@@ -7,6 +7,9 @@ from read_pdf import *
 from write_pdf import *
 from image_tools import *
 from langgraph.prebuilt import ToolNode
+import http_client
+import asyncio
+import functools
 import os
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.graph import END, START, StateGraph
@@ -17,18 +20,19 @@ load_dotenv()
 class State(TypedDict):
     messages: Annotated[list,add_messages]
 
-tools = [arxiv_search, read_pdf, render_latex_pdf, download_image_from_url, create_research_plot, generate_latex_figure_code, create_table_latex]
-tool_node = ToolNode(tools)
+tools = [arxiv_search, arxiv_search_and_fetch, read_pdf, render_latex_pdf, render_all, download_image_from_url, create_research_plot, generate_latex_figure_code, create_table_latex]
 
 
-model = ChatGoogleGenerativeAI(model="gemini-2.5-pro",
-                               api_key=os.getenv("GOOGLE_API_KEY"),
-                               )
-model = model.bind_tools(tools)
+@functools.cache
+def get_model():
+    model = ChatGoogleGenerativeAI(model="gemini-2.5-pro",
+                                   api_key=os.getenv("GOOGLE_API_KEY"),
+                                   )
+    return model.bind_tools(tools)
 
-def call_model(state: State):
+async def call_model(state: State):
     messages = state["messages"]
-    response = model.invoke(messages)
+    response = await get_model().ainvoke(messages)
     return {"messages": [response]} 
 
 def should_continue(state: State) -> Literal["tools", END]:
@@ -38,17 +42,18 @@ def should_continue(state: State) -> Literal["tools", END]:
         return "tools"
     return END
 
-workflow = StateGraph(State)
-workflow.add_node("agent",call_model)
-workflow.add_node("tools",tool_node)
-workflow.add_edge(START,"agent")
-workflow.add_conditional_edges("agent",should_continue)
-workflow.add_edge("tools", "agent")
-
 checkpointer = MemorySaver()
 config = {"configurable": {"thread_id": 20000}}
 
-graph = workflow.compile(checkpointer=checkpointer)
+@functools.cache
+def get_graph():
+    workflow = StateGraph(State)
+    workflow.add_node("agent",call_model)
+    workflow.add_node("tools",ToolNode(tools))
+    workflow.add_edge(START,"agent")
+    workflow.add_conditional_edges("agent",should_continue)
+    workflow.add_edge("tools", "agent")
+    return workflow.compile(checkpointer=checkpointer)
 
 
 INITIAL_PROMPT = """
@@ -76,7 +81,10 @@ AVAILABLE TOOLS FOR COMPREHENSIVE RESEARCH PRESENTATION:
 
 📄 IEEE FORMATTING TOOLS:
 - render_latex_pdf(): Renders LaTeX to PDF with IEEE formatting
+- render_all(): Creates all research plots concurrently and then renders the LaTeX to PDF in one call.
+  PREFER render_all() over separate create_research_plot() and render_latex_pdf() calls when writing the final paper
 - arxiv_search(): Search for papers on arXiv
+- arxiv_search_and_fetch(): Search arXiv for several topics concurrently in a single call
 - read_pdf(): Read and analyze PDF papers
 
 📊 IMAGE AND FIGURE TOOLS:
@@ -145,20 +153,30 @@ Finally, I'll ask you to go ahead and write the paper in IEEE format with intera
 When you give paper references, always include the arXiv links and use proper IEEE citation format.
 Remember: You're not just creating a paper, you're creating a comprehensive research presentation with both static and interactive components!"""
 
-def print_stream(stream):
-    for s in stream:
+async def print_stream(stream):
+    async for s in stream:
         message = s["messages"][-1]
         print(f"Message received: {message.content[:200]}...")
         message.pretty_print()
 
-while True:
-    user_input = input("User: ")
-    if user_input:
-        messages = [
-                    {"role": "system", "content": INITIAL_PROMPT},
-                    {"role": "user", "content": user_input}
-                ]
-        input_data = {
-            "messages" : messages
-        }
-        print_stream(graph.stream(input_data, config, stream_mode="values"))
\ No newline at end of file
+async def main():
+    graph = get_graph()
+    try:
+        while True:
+            # read stdin off the event loop so pending tasks keep running
+            user_input = await asyncio.to_thread(input, "User: ")
+            if user_input:
+                messages = [{"role": "user", "content": user_input}]
+                # the checkpointer keeps the system prompt, so only the first turn sends it
+                state = await graph.aget_state(config)
+                if not state.values.get("messages"):
+                    messages.insert(0, {"role": "system", "content": INITIAL_PROMPT})
+                input_data = {
+                    "messages" : messages
+                }
+                await print_stream(graph.astream(input_data, config, stream_mode="values"))
+    finally:
+        await http_client.aclose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
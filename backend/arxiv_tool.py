@@ -1,15 +1,35 @@
 #Access arxiv using url
-import requests
-import xml.etree.ElementTree as ET
+import asyncio
+import copy
+import orjson
+import re
+from typing import AsyncIterator
+from cachetools import TTLCache
+from lxml import etree as ET
 from langchain_core.tools import tool
+from http_client import get_client
 
-def search_arxiv_paper(topic: str,max_results: int=5) -> dict:
-    query = "+".join(topic.lower().split())
-    for char in list('()" '):
-        if char in query:
-            print(f"Invalid character '{char}' in query: {query}")
-            raise ValueError(f"Cannot have character: '{char}' in query: {query}")
-        
+# arXiv listings change daily, so cached searches expire after an hour
+_search_cache = TTLCache(maxsize=256, ttl=60 * 60)
+_WHITESPACE = re.compile(r"\s+")
+_BAD_QUERY_CHARS = re.compile(r'[()" ]')
+
+async def search_arxiv_paper(topic: str,max_results: int=5) -> dict:
+    query = _WHITESPACE.sub("+", topic.lower().strip())
+    bad = _BAD_QUERY_CHARS.search(query)
+    if bad:
+        print(f"Invalid character '{bad.group()}' in query: {query}")
+        raise ValueError(f"Cannot have character: '{bad.group()}' in query: {query}")
+
+    key = (query, max_results)
+    entries = _search_cache.get(key)
+    if entries is None:
+        entries = await _fetch_arxiv_entries(query, max_results)
+        _search_cache[key] = entries
+    data = {"entries": copy.deepcopy(list(entries))}
+    return data
+
+async def _fetch_arxiv_entries(query: str, max_results: int) -> tuple[dict, ...]:
     url = (
             "http://export.arxiv.org/api/query"
             f"?search_query=all:{query}"
@@ -17,52 +37,56 @@ def search_arxiv_paper(topic: str,max_results: int=5) -> dict:
             "&sortBy=submittedDate"
             "&sortOrder=descending"
         )
-    resp = requests.get(url)
-    if not resp.ok:
-        print(f"ArXiv API request failed: {resp.status_code} - {resp.text}")
-        raise ValueError(f"Bad response from arXiv API: {resp}\n{resp.text}")
-    
-    data = parse_arxiv_xml(resp.text)
-    return data
+    async with get_client().stream("GET", url) as resp:
+        if not resp.is_success:
+            await resp.aread()
+            print(f"ArXiv API request failed: {resp.status_code} - {resp.text}")
+            raise ValueError(f"Bad response from arXiv API: {resp}\n{resp.text}")
+
+        return tuple([entry async for entry in parse_arxiv_xml(resp.aiter_bytes())])
 
 
 #parsing xml
-def parse_arxiv_xml(xml_content: str) -> dict:
-    entries = []
-    ns = {
-        "atom": "http://www.w3.org/2005/Atom",
-        "arxiv": "http://arxiv.org/schemas/atom"
+NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "arxiv": "http://arxiv.org/schemas/atom"
+}
+ENTRY_TAG = f"{{{NS['atom']}}}entry"
+
+# precompiled so each lookup runs inside libxml2; plain str results keep no reference to the entry
+_TITLE = ET.XPath("string(atom:title)", namespaces=NS, smart_strings=False)
+_SUMMARY = ET.XPath("string(atom:summary)", namespaces=NS, smart_strings=False)
+_AUTHORS = ET.XPath("atom:author/atom:name/text()", namespaces=NS, smart_strings=False)
+_CATS = ET.XPath("atom:category/@term", namespaces=NS, smart_strings=False)
+_PDF = ET.XPath("atom:link[@type='application/pdf']/@href", namespaces=NS, smart_strings=False)
+
+async def parse_arxiv_xml(chunks: AsyncIterator[bytes]) -> AsyncIterator[dict]:
+    # entries are yielded as soon as they are parsed, while the rest of the feed is still streaming in
+    parser = ET.XMLPullParser(events=("end",), tag=ENTRY_TAG)
+    async for chunk in chunks:
+        parser.feed(chunk)
+        for _, entry in parser.read_events():
+            yield parse_entry(entry)
+
+            # free the finished entry and everything parsed before it
+            entry.clear(keep_tail=True)
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+    parser.close()
+
+def parse_entry(entry) -> dict:
+    return {
+        "title": _TITLE(entry),
+        "summary": _SUMMARY(entry).strip(),
+        "authors": _AUTHORS(entry),
+        "categories": _CATS(entry),
+        "pdf": (_PDF(entry) or [None])[0]
     }
-    root = ET.fromstring(xml_content)
-    for entry in root.findall("atom:entry",ns):
-        authors = [
-            author.findtext("atom:name",namespaces=ns)
-            for author in entry.findall("atom:author",ns)
-        ]
-
-        categories = [
-            cat.attrib.get("term")
-            for cat in entry.findall("atom:category",ns)
-        ]
-
-        pdf_link = None
-        for link in entry.findall("atom:link",ns):
-            if link.attrib.get("type") == "application/pdf":
-                pdf_link = link.attrib.get("href")
-                break
-        entries.append({
-            "title": entry.findtext("atom:title",namespaces=ns),
-            "summary":entry.findtext("atom:summary",namespaces=ns).strip(),
-            "authors":authors,
-            "categories": categories,
-            "pdf": pdf_link
-        })
-    return {"entries": entries}
 
 # creating langchain tool 
 
 @tool
-def arxiv_search(topic: str) -> list[dict]:
+async def arxiv_search(topic: str) -> str:
     """
     Now You Can search for recently uploded papers
     
@@ -70,12 +94,40 @@ def arxiv_search(topic: str) -> list[dict]:
         topic: the topic to search for
 
     Returns:
-        List of papers and metadata
+        JSON object with the list of papers and metadata
     """
-    papers = search_arxiv_paper(topic)
+    papers = await search_arxiv_paper(topic)
     if len(papers["entries"]) == 0:
         print(f"No papers found for topic: {topic}")
         raise ValueError(f"No papers found for topic: {topic}")
     
     print(f"Found {len(papers['entries'])} papers about {topic}")
-    return papers
+    # serialize here with orjson rather than leaving it to ToolNode's stdlib json
+    return orjson.dumps(papers).decode()
+
+@tool
+async def arxiv_search_and_fetch(topics: list[str], max_concurrency: int = 6) -> str:
+    """
+    Search for recently uploaded papers on several topics at once
+
+    Args:
+        topics: the topics to search for
+        max_concurrency: how many arXiv queries may run at the same time
+
+    Returns:
+        JSON list with one result per topic, holding its papers and metadata or the error it hit
+    """
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _one(topic: str) -> dict:
+        async with sem:
+            try:
+                papers = await search_arxiv_paper(topic)
+            except Exception as e:
+                print(f"Search failed for topic {topic}: {e}")
+                return {"topic": topic, "error": str(e)}
+        print(f"Found {len(papers['entries'])} papers about {topic}")
+        return {"topic": topic, **papers}
+
+    results = await asyncio.gather(*(_one(t) for t in topics))
+    return orjson.dumps(results).decode()
@@ -0,0 +1,29 @@
+import asyncio
+import weakref
+
+import httpx
+
+# One connection pool per event loop, shared by every tool that goes over the network.
+# Pooled connections are bound to the loop that opened them, so a client must never be
+# reused from another loop (e.g. a second asyncio.run call).
+_clients = weakref.WeakKeyDictionary()
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client for the running event loop, creating it on first use.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = httpx.AsyncClient(http2=True, timeout=30, follow_redirects=True)
+    return client
+
+
+async def aclose() -> None:
+    """
+    Close the running event loop's HTTP client, if one was created.
+    """
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,5 @@
+import os
+from pathlib import Path
+
+# resolved once; image tools and dashboard exports write here unless given another directory
+IMAGES_DIR = Path(os.environ.get("AUTOPAPER_OUT", "./output/images")).resolve()
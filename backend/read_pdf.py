@@ -1,10 +1,23 @@
 from langchain_core.tools import tool
+import asyncio
 import io
 import PyPDF2
-import requests
+from http_client import get_client
+
+def extract_pdf_text(content: bytes) -> str:
+    pdf_file = io.BytesIO(content) #converts the downloaded bytes into a file-like object in memory (so PyPDF2 can read it without saving to disk)
+    pdf_reader = PyPDF2.PdfReader(pdf_file)
+    num_pages = len(pdf_reader.pages)
+    text = ""
+    
+    for i,page in enumerate(pdf_reader.pages,1):
+        print(f"Extracting text from page {i}/{num_pages}")
+        text += page.extract_text() + "\n"
+    print(f"Successfully extracted {len(text)} characters of text from PDF")
+    return text.strip()
 
 @tool
-def read_pdf(url: str) -> str:
+async def read_pdf(url: str) -> str:
     """Read and extract text from a PDF file given its URL.
 
     Args:
@@ -14,17 +27,9 @@ def read_pdf(url: str) -> str:
         The extracted text content from the PDF
     """
     try:
-        response = requests.get(url)
-        pdf_file = io.BytesIO(response.content) #converts the downloaded bytes into a file-like object in memory (so PyPDF2 can read it without saving to disk)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        num_pages = len(pdf_reader.pages)
-        text = ""
-        
-        for i,page in enumerate(pdf_reader.pages,1):
-            print(f"Extracting text from page {i}/{num_pages}")
-            text += page.extract_text() + "\n"
-        print(f"Successfully extracted {len(text)} characters of text from PDF")
-        return text.strip()
+        response = await get_client().get(url)
+        # text extraction is CPU bound, keep it off the event loop
+        return await asyncio.to_thread(extract_pdf_text, response.content)
     except Exception as e:
         print(f"Error reading PDF: {str(e)}")
-        raise
\ No newline at end of file
+        raise
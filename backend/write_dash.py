@@ -1,357 +1,507 @@
 import dash
-from dash import dcc, html, Input, Output, callback
-import plotly.graph_objects as go
+from dash import dcc, html, Input, Output, State
 import plotly.express as px
+import plotly.io as pio
+from paths import IMAGES_DIR
+from hypercorn.config import Config
+from hypercorn.asyncio import serve
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import webbrowser
 import threading
 import time
-from pathlib import Path
-import os
-
-def create_research_dashboard(title: str, port: int = 8050) -> str:
+import socket
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import asyncio
+
+# Serialize figures and Dash callback payloads with orjson instead of stdlib json
+pio.json.config.default_engine = 'orjson'
+
+# Exported dashboard plots land next to the paper figures from image_tools
+try:
+    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+except OSError as e:
+    print(f"Could not create output directory {IMAGES_DIR}: {e}")
+
+# Seeded PCG64 generator for the sample data, so every run draws the same noise
+_RNG = np.random.default_rng(0)
+
+def _read_only(array):
+    array.flags.writeable = False
+    return array
+
+# Exponential decay templates for the loss curves, computed once at import
+_DECAY_3 = _read_only(np.exp(-np.linspace(0, 3, 100)))
+_DECAY_28 = _read_only(np.exp(-np.linspace(0, 2.8, 100)))
+
+def _loss_curve(decay, noise_scale):
+    # decay + scale * noise, computed in place on the noise buffer
+    curve = _RNG.standard_normal(decay.size)
+    curve *= noise_scale
+    curve += decay
+    return _read_only(curve)
+
+# Sample data generation based on config. The result is cached and shared
+# between callers, so it is returned as a read-only mapping of immutable values.
+@functools.lru_cache(maxsize=None)
+def generate_sample_data(chart_type):
+    if chart_type == 'performance':
+        return MappingProxyType({
+            'epochs': _read_only(np.arange(1, 101, dtype=np.int32)),
+            'training_loss': _loss_curve(_DECAY_3, 0.1),
+            'validation_loss': _loss_curve(_DECAY_28, 0.15)
+        })
+    elif chart_type == 'comparison':
+        return MappingProxyType({
+            'methods': ('Baseline', 'Method A', 'Method B', 'Proposed'),
+            'accuracy': (0.75, 0.82, 0.78, 0.91),
+            'precision': (0.73, 0.80, 0.76, 0.89),
+            'recall': (0.77, 0.84, 0.80, 0.93)
+        })
+    elif chart_type == 'rating':
+        return MappingProxyType({
+            'criteria': ('Novelty', 'Technical Quality', 'Clarity', 'Significance', 'Reproducibility'),
+            'scores': (4.2, 4.5, 4.0, 4.3, 3.8),
+            'max_score': 5.0
+        })
+    return MappingProxyType({})
+
+def _port_open(port: int) -> bool:
+    with socket.socket() as s:
+        return s.connect_ex(('127.0.0.1', port)) == 0
+
+def _wait_for_server(port: int, timeout: float = 5.0) -> bool:
     """
-    Create an interactive research dashboard with flowcharts, graphs, and ratings.
-
-    Args:
-        title: Dashboard title
-        port: Port to run the dashboard on
+    Poll the local port until the dashboard server accepts connections.
 
     Returns:
-        URL of the running dashboard
+        True once the port is open, False if the timeout passed first
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if _port_open(port):
+            return True
+        time.sleep(0.01)
+    return False
+
+# Figures are plain dict specs serialized as-is, which skips plotly.py's
+# per-property validation. The default template is resolved once so they still
+# render like go.Figure output.
+_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+
+def _figure(data, layout):
+    return {'data': data, 'layout': {'template': _TEMPLATE, **layout}}
+
+def _flowchart_traces(nodes, connections, half_width, arrow_gap, font_size):
     """
+    Build a whole flowchart as three Scatter traces (boxes, labels, arrows)
+    instead of one shape/annotation per node, which plotly revalidates each time.
+    """
+    xs = np.array([node['x'] for node in nodes], dtype=float)
+    ys = np.array([node['y'] for node in nodes], dtype=float)
+    gaps = np.full_like(xs, np.nan)
+
+    # Every box is a closed polygon; NaN breaks the outline between boxes
+    box_x = np.column_stack([xs - half_width, xs + half_width, xs + half_width, xs - half_width, xs - half_width, gaps]).ravel()
+    box_y = np.column_stack([ys - 0.2, ys - 0.2, ys + 0.2, ys + 0.2, ys - 0.2, gaps]).ravel()
+
+    # Arrows are line segments whose end point carries an arrowhead marker
+    index = {node['id']: i for i, node in enumerate(nodes)}
+    src = np.array([index[from_id] for from_id, _ in connections], dtype=int)
+    dst = np.array([index[to_id] for _, to_id in connections], dtype=int)
+    arrow_gaps = np.full(len(connections), np.nan)
+    arrow_x = np.column_stack([xs[src], xs[dst], arrow_gaps]).ravel()
+    arrow_y = np.column_stack([ys[src] - arrow_gap, ys[dst] + arrow_gap, arrow_gaps]).ravel()
+    arrow_sizes = np.tile([0, 12, 0], len(connections))
+
+    return [
+        {
+            'type': 'scatter',
+            'x': box_x, 'y': box_y,
+            'mode': 'lines',
+            'fill': 'toself',
+            'fillcolor': "lightblue",
+            'line': {'color': "darkblue", 'width': 2},
+            'hoverinfo': 'skip'
+        },
+        {
+            'type': 'scatter',
+            'x': xs, 'y': ys,
+            'mode': 'text',
+            'text': [node['label'] for node in nodes],
+            'textposition': 'middle center',
+            'textfont': {'size': font_size, 'color': "black"},
+            'hoverinfo': 'skip'
+        },
+        {
+            'type': 'scatter',
+            'x': arrow_x, 'y': arrow_y,
+            'mode': 'lines+markers',
+            'line': {'color': "darkblue", 'width': 2},
+            'marker': {'symbol': 'arrow', 'angleref': 'previous', 'size': arrow_sizes, 'color': "darkblue"},
+            'hoverinfo': 'skip'
+        },
+    ]
+
+def create_flowchart():
+    # Define flowchart nodes
+    nodes = [
+        {'id': 'start', 'label': 'Data Collection', 'x': 1, 'y': 5},
+        {'id': 'preprocess', 'label': 'Data Preprocessing', 'x': 1, 'y': 4},
+        {'id': 'model', 'label': 'Model Training', 'x': 1, 'y': 3},
+        {'id': 'evaluate', 'label': 'Evaluation', 'x': 1, 'y': 2},
+        {'id': 'results', 'label': 'Results Analysis', 'x': 1, 'y': 1}
+    ]
+
+    # Each step flows into the next one
+    connections = [(a['id'], b['id']) for a, b in zip(nodes, nodes[1:])]
+
+    # Add nodes and arrows
+    return _figure(_flowchart_traces(nodes, connections, half_width=0.3, arrow_gap=0.3, font_size=12), {
+        'title': {'text': "Research Methodology Flowchart"},
+        'xaxis': {'range': [0, 2], 'showgrid': False, 'showticklabels': False},
+        'yaxis': {'range': [0, 6], 'showgrid': False, 'showticklabels': False},
+        'showlegend': False,
+        'height': 500
+    })
+
+# Chart text and styling shared by the interactive figures and the static images,
+# as (data key, legend name, colour) per series, so the two renderings cannot drift apart
+_PERFORMANCE_CHART = {
+    'title': "Model Performance Over Time",
+    'xlabel': "Epochs",
+    'ylabel': "Loss",
+    'series': (('training_loss', 'Training Loss', 'blue'), ('validation_loss', 'Validation Loss', 'red')),
+}
+_COMPARISON_CHART = {
+    'title': "Method Comparison",
+    'ylabel': "Score",
+    'bar_width': 0.25,
+    'series': (('accuracy', 'Accuracy', 'lightblue'), ('precision', 'Precision', 'lightgreen'), ('recall', 'Recall', 'lightcoral')),
+}
+# The rating chart has no data series, only (legend name, colour) for its two rings
+_RATING_CHART = {
+    'title': "Paper Quality Rating",
+    'score': ('Current Paper', 'blue'),
+    'reference': ('Maximum Score', 'lightgray'),
+}
+
+def _comparison_bars(data):
+    """
+    Bar positions for the comparison chart: a (positions, values, name, colour)
+    tuple per series, with the series side by side around each method's tick.
+    """
+    series = _COMPARISON_CHART['series']
+    x = np.arange(len(data['methods']))
+    offsets = (np.arange(len(series)) - (len(series) - 1) / 2) * _COMPARISON_CHART['bar_width']
 
-    app = dash.Dash(__name__)
+    # One (series, method) array each for positions and values, sliced per trace
+    positions = x + offsets[:, np.newaxis]
+    values = np.array([data[key] for key, _, _ in series])
+    return x, [(pos, val, name, color) for pos, val, (_, name, color) in zip(positions, values, series)]
 
-    # Sample data generation based on config
-    def generate_sample_data(chart_type):
-        if chart_type == 'performance':
-            return {
-                'epochs': list(range(1, 101)),
-                'training_loss': np.exp(-np.linspace(0, 3, 100)) + 0.1 * np.random.randn(100),
-                'validation_loss': np.exp(-np.linspace(0, 2.8, 100)) + 0.15 * np.random.randn(100)
-            }
-        elif chart_type == 'comparison':
-            return {
-                'methods': ['Baseline', 'Method A', 'Method B', 'Proposed'],
-                'accuracy': [0.75, 0.82, 0.78, 0.91],
-                'precision': [0.73, 0.80, 0.76, 0.89],
-                'recall': [0.77, 0.84, 0.80, 0.93]
-            }
-        elif chart_type == 'rating':
-            return {
-                'criteria': ['Novelty', 'Technical Quality', 'Clarity', 'Significance', 'Reproducibility'],
-                'scores': [4.2, 4.5, 4.0, 4.3, 3.8],
-                'max_score': 5.0
-            }
-        return {}
-
-    # Create flowchart
-    def create_flowchart():
-        fig = go.Figure()
-
-        # Define flowchart nodes
-        nodes = [
-            {'id': 'start', 'label': 'Data Collection', 'x': 1, 'y': 5},
-            {'id': 'preprocess', 'label': 'Data Preprocessing', 'x': 1, 'y': 4},
-            {'id': 'model', 'label': 'Model Training', 'x': 1, 'y': 3},
-            {'id': 'evaluate', 'label': 'Evaluation', 'x': 1, 'y': 2},
-            {'id': 'results', 'label': 'Results Analysis', 'x': 1, 'y': 1}
-        ]
-
-        # Add nodes
-        for node in nodes:
-            fig.add_shape(
-                type="rect",
-                x0=node['x']-0.3, y0=node['y']-0.2,
-                x1=node['x']+0.3, y1=node['y']+0.2,
-                fillcolor="lightblue",
-                line=dict(color="darkblue", width=2)
-            )
-            fig.add_annotation(
-                x=node['x'], y=node['y'],
-                text=node['label'],
-                showarrow=False,
-                font=dict(size=12, color="black")
-            )
-
-        # Add arrows
-        for i in range(len(nodes)-1):
-            fig.add_annotation(
-                x=nodes[i]['x'], y=nodes[i]['y']-0.3,
-                ax=nodes[i+1]['x'], ay=nodes[i+1]['y']+0.3,
-                arrowhead=2, arrowsize=1, arrowwidth=2,
-                arrowcolor="darkblue"
-            )
-
-        fig.update_layout(
-            title="Research Methodology Flowchart",
-            xaxis=dict(range=[0, 2], showgrid=False, showticklabels=False),
-            yaxis=dict(range=[0, 6], showgrid=False, showticklabels=False),
-            showlegend=False,
-            height=500
-        )
-
-        return fig
-
-    # Create performance graph
-    def create_performance_graph():
-        data = generate_sample_data('performance')
-
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=data['epochs'],
-            y=data['training_loss'],
-            mode='lines',
-            name='Training Loss',
-            line=dict(color='blue', width=2)
-        ))
-        fig.add_trace(go.Scatter(
-            x=data['epochs'],
-            y=data['validation_loss'],
-            mode='lines',
-            name='Validation Loss',
-            line=dict(color='red', width=2)
-        ))
-
-        fig.update_layout(
-            title="Model Performance Over Time",
-            xaxis_title="Epochs",
-            yaxis_title="Loss",
-            hovermode='x unified',
-            height=400
-        )
-
-        return fig
-
-    # Create comparison chart
-    def create_comparison_chart():
-        data = generate_sample_data('comparison')
-
-        fig = go.Figure()
-
-        x = np.arange(len(data['methods']))
-        width = 0.25
-
-        fig.add_trace(go.Bar(
-            x=[i - width for i in x],
-            y=data['accuracy'],
-            name='Accuracy',
-            marker_color='lightblue'
-        ))
-        fig.add_trace(go.Bar(
-            x=x,
-            y=data['precision'],
-            name='Precision',
-            marker_color='lightgreen'
-        ))
-        fig.add_trace(go.Bar(
-            x=[i + width for i in x],
-            y=data['recall'],
-            name='Recall',
-            marker_color='lightcoral'
-        ))
-
-        fig.update_layout(
-            title="Method Comparison",
-            xaxis=dict(tickvals=x, ticktext=data['methods']),
-            yaxis_title="Score",
-            barmode='group',
-            height=400
-        )
-
-        return fig
-
-    # Create rating chart
-    def create_rating_chart():
-        data = generate_sample_data('rating')
-
-        fig = go.Figure()
-
-        fig.add_trace(go.Scatterpolar(
-            r=data['scores'],
-            theta=data['criteria'],
-            fill='toself',
-            name='Current Paper',
-            line_color='blue'
-        ))
+# Create performance graph
+def create_performance_graph():
+    data = generate_sample_data('performance')
 
+    return _figure([
+        {
+            'type': 'scatter',
+            'x': data['epochs'],
+            'y': data[key],
+            'mode': 'lines',
+            'name': name,
+            'line': {'color': color, 'width': 2}
+        }
+        for key, name, color in _PERFORMANCE_CHART['series']
+    ], {
+        'title': {'text': _PERFORMANCE_CHART['title']},
+        'xaxis': {'title': {'text': _PERFORMANCE_CHART['xlabel']}},
+        'yaxis': {'title': {'text': _PERFORMANCE_CHART['ylabel']}},
+        'hovermode': 'x unified',
+        'height': 400
+    })
+
+# Create comparison chart
+def create_comparison_chart():
+    data = generate_sample_data('comparison')
+    x, bars = _comparison_bars(data)
+
+    return _figure([
+        {
+            'type': 'bar',
+            'x': positions,
+            'y': values,
+            'name': name,
+            'marker': {'color': color}
+        }
+        for positions, values, name, color in bars
+    ], {
+        'title': {'text': _COMPARISON_CHART['title']},
+        'xaxis': {'tickvals': x, 'ticktext': data['methods']},
+        'yaxis': {'title': {'text': _COMPARISON_CHART['ylabel']}},
+        'barmode': 'group',
+        'height': 400
+    })
+
+# Create rating chart
+def create_rating_chart():
+    data = generate_sample_data('rating')
+    score_name, score_color = _RATING_CHART['score']
+    max_name, max_color = _RATING_CHART['reference']
+
+    return _figure([
+        {
+            'type': 'scatterpolar',
+            'r': data['scores'],
+            'theta': data['criteria'],
+            'fill': 'toself',
+            'name': score_name,
+            'line': {'color': score_color}
+        },
         # Add maximum score reference
-        fig.add_trace(go.Scatterpolar(
-            r=[data['max_score']] * len(data['criteria']),
-            theta=data['criteria'],
-            fill='toself',
-            name='Maximum Score',
-            line_color='lightgray',
-            opacity=0.3
-        ))
-
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, data['max_score']]
-                )
-            ),
-            title="Paper Quality Rating",
-            height=500
-        )
-
-        return fig
-
-    # Dashboard layout
-    app.layout = html.Div([
-        html.H1(title, style={'textAlign': 'center', 'marginBottom': 30}),
+        {
+            'type': 'scatterpolar',
+            'r': [data['max_score']] * len(data['criteria']),
+            'theta': data['criteria'],
+            'fill': 'toself',
+            'name': max_name,
+            'line': {'color': max_color},
+            'opacity': 0.3
+        },
+    ], {
+        'polar': {
+            'radialaxis': {
+                'visible': True,
+                'range': [0, data['max_score']]
+            }
+        },
+        'title': {'text': _RATING_CHART['title']},
+        'height': 500
+    })
+
+def create_custom_flow(title: str):
+    # Define sample nodes for research methodology
+    nodes = [
+        {'id': 'problem', 'label': 'Problem Definition', 'x': 1, 'y': 6},
+        {'id': 'literature', 'label': 'Literature Review', 'x': 1, 'y': 5},
+        {'id': 'hypothesis', 'label': 'Hypothesis Formation', 'x': 1, 'y': 4},
+        {'id': 'methodology', 'label': 'Methodology Design', 'x': 1, 'y': 3},
+        {'id': 'experiment', 'label': 'Experimentation', 'x': 1, 'y': 2},
+        {'id': 'analysis', 'label': 'Data Analysis', 'x': 1, 'y': 1},
+        {'id': 'conclusion', 'label': 'Conclusions', 'x': 1, 'y': 0}
+    ]
+
+    connections = [
+        ('problem', 'literature'),
+        ('literature', 'hypothesis'),
+        ('hypothesis', 'methodology'),
+        ('methodology', 'experiment'),
+        ('experiment', 'analysis'),
+        ('analysis', 'conclusion')
+    ]
+
+    # Add nodes and connections
+    return _figure(_flowchart_traces(nodes, connections, half_width=0.4, arrow_gap=0.25, font_size=10), {
+        'title': {'text': title},
+        'xaxis': {'showgrid': False, 'showticklabels': False},
+        'yaxis': {'showgrid': False, 'showticklabels': False},
+        'showlegend': False,
+        'height': 600
+    })
+
+# One Dash app (and one server thread) backs every dashboard. Each create_* call
+# registers its graphs as tabs; the layout is rebuilt from them on page load.
+app = dash.Dash(__name__)
+_dashboard = {'title': 'Research Dashboard', 'active': None, 'url': None}
+_tabs = {}  # tab value -> (label, figure JSON)
+_server_lock = threading.Lock()
+
+def _serve_layout():
+    return html.Div([
+        html.H1(_dashboard['title'], style={'textAlign': 'center', 'marginBottom': 30}),
 
         # Tabs for different visualizations
-        dcc.Tabs(id="tabs", value='flowchart', children=[
-            dcc.Tab(label='Methodology Flowchart', value='flowchart'),
-            dcc.Tab(label='Performance Analysis', value='performance'),
-            dcc.Tab(label='Method Comparison', value='comparison'),
-            dcc.Tab(label='Quality Rating', value='rating'),
+        dcc.Tabs(id="tabs", value=_dashboard['active'], children=[
+            dcc.Tab(label=label, value=value) for value, (label, _) in _tabs.items()
         ]),
 
-        html.Div(id='tab-content', style={'margin': 20})
+        # Every figure ships with the page; switching tabs only swaps them in the browser
+        dcc.Store(id='figures', data={value: figure for value, (_, figure) in _tabs.items()}),
+        dcc.Graph(id='current-graph', style={'margin': 20})
     ])
 
-    # Callback for tab content
-    @app.callback(Output('tab-content', 'children'),
-                  Input('tabs', 'value'))
-    def render_content(tab):
-        if tab == 'flowchart':
-            return dcc.Graph(figure=create_flowchart())
-        elif tab == 'performance':
-            return dcc.Graph(figure=create_performance_graph())
-        elif tab == 'comparison':
-            return dcc.Graph(figure=create_comparison_chart())
-        elif tab == 'rating':
-            return dcc.Graph(figure=create_rating_chart())
-
-    # Run the app
-    def run_app():
-        app.run_server(debug=False, port=port, host='127.0.0.1')
-
-    # Start the server in a separate thread
-    server_thread = threading.Thread(target=run_app)
-    server_thread.daemon = True
-    server_thread.start()
-
-    # Wait a moment for server to start
-    time.sleep(2)
-
-    dashboard_url = f"http://127.0.0.1:{port}"
+app.layout = _serve_layout
+
+# Tab content is picked client-side, without a round trip to the server
+app.clientside_callback(
+    """
+    function(tab, figures) {
+        if (!figures || !figures[tab]) {
+            return window.dash_clientside.no_update;
+        }
+        return JSON.parse(figures[tab]);
+    }
+    """,
+    Output('current-graph', 'figure'),
+    Input('tabs', 'value'),
+    State('figures', 'data')
+)
+
+def _show_dashboard(active: str, port: int) -> str:
+    """
+    Select a tab, start the shared server on first use and open the browser.
+
+    Returns:
+        URL of the running dashboard
+    """
+    _dashboard['active'] = active
+
+    with _server_lock:
+        if _dashboard['url'] is None:
+            # Something else answering on the port would pass the readiness probe below
+            if _port_open(port):
+                raise RuntimeError(f"Port {port} is already in use, dashboard server not started")
+
+            # Run the app in a separate thread
+            def run_app():
+                # Hypercorn serves the Flask app in WSGI mode on its own event loop, running
+                # requests on an executor thread pool so they overlap.
+                # The thread is a daemon, so it never shuts down on its own; passing a
+                # shutdown trigger also skips hypercorn's main-thread-only signal handlers.
+                config = Config.from_mapping(bind=[f'127.0.0.1:{port}'], accesslog=None)
+                asyncio.run(serve(app.server, config, mode='wsgi', shutdown_trigger=asyncio.Event().wait))
+
+            server_thread = threading.Thread(target=run_app)
+            server_thread.daemon = True
+            server_thread.start()
+
+            # Wait until the server accepts connections; on failure the URL stays unset
+            # so the next call tries to start the server again
+            if not _wait_for_server(port):
+                raise RuntimeError(f"Dashboard server did not start on port {port}")
+            _dashboard['url'] = f"http://127.0.0.1:{port}"
+
+    dashboard_url = _dashboard['url']
 
     # Open browser automatically
     webbrowser.open(dashboard_url)
-
-    print(f"Research dashboard running at: {dashboard_url}")
     return dashboard_url
 
-def create_custom_flowchart(title: str = "Custom Flowchart", port: int = 8051) -> str:
+def create_research_dashboard(title: str, port: int = 8050) -> str:
     """
-    Create a custom flowchart for research methodology.
+    Create an interactive research dashboard with flowcharts, graphs, and ratings.
 
     Args:
-        title: Flowchart title
-        port: Port to run the dashboard on
+        title: Dashboard title
+        port: Port to run the dashboard on (ignored if the server is already running)
 
     Returns:
-        URL of the dashboard
+        URL of the running dashboard
     """
 
-    app = dash.Dash(__name__)
-
-    def create_custom_flow():
-        fig = go.Figure()
-
-        # Define sample nodes for research methodology
-        nodes = [
-            {'id': 'problem', 'label': 'Problem Definition', 'x': 1, 'y': 6},
-            {'id': 'literature', 'label': 'Literature Review', 'x': 1, 'y': 5},
-            {'id': 'hypothesis', 'label': 'Hypothesis Formation', 'x': 1, 'y': 4},
-            {'id': 'methodology', 'label': 'Methodology Design', 'x': 1, 'y': 3},
-            {'id': 'experiment', 'label': 'Experimentation', 'x': 1, 'y': 2},
-            {'id': 'analysis', 'label': 'Data Analysis', 'x': 1, 'y': 1},
-            {'id': 'conclusion', 'label': 'Conclusions', 'x': 1, 'y': 0}
-        ]
-
-        connections = [
-            ('problem', 'literature'),
-            ('literature', 'hypothesis'),
-            ('hypothesis', 'methodology'),
-            ('methodology', 'experiment'),
-            ('experiment', 'analysis'),
-            ('analysis', 'conclusion')
-        ]
-
-        # Add nodes
-        for node in nodes:
-            fig.add_shape(
-                type="rect",
-                x0=node['x']-0.4, y0=node['y']-0.2,
-                x1=node['x']+0.4, y1=node['y']+0.2,
-                fillcolor="lightblue",
-                line=dict(color="darkblue", width=2)
-            )
-            fig.add_annotation(
-                x=node['x'], y=node['y'],
-                text=node['label'],
-                showarrow=False,
-                font=dict(size=10, color="black")
-            )
-
-        # Add connections
-        node_dict = {node['id']: node for node in nodes}
-        for from_id, to_id in connections:
-            from_node = node_dict[from_id]
-            to_node = node_dict[to_id]
-
-            fig.add_annotation(
-                x=from_node['x'], y=from_node['y']-0.25,
-                ax=to_node['x'], ay=to_node['y']+0.25,
-                arrowhead=2, arrowsize=1, arrowwidth=2,
-                arrowcolor="darkblue"
-            )
-
-        fig.update_layout(
-            title=title,
-            xaxis=dict(showgrid=False, showticklabels=False),
-            yaxis=dict(showgrid=False, showticklabels=False),
-            showlegend=False,
-            height=600
-        )
-
-        return fig
-
-    app.layout = html.Div([
-        html.H1(title, style={'textAlign': 'center'}),
-        dcc.Graph(figure=create_custom_flow())
-    ])
+    # Figures never change at runtime, so serialize them once up front
+    _dashboard['title'] = title
+    _tabs.update({
+        'flowchart': ('Methodology Flowchart', pio.to_json(create_flowchart(), validate=False)),
+        'performance': ('Performance Analysis', pio.to_json(create_performance_graph(), validate=False)),
+        'comparison': ('Method Comparison', pio.to_json(create_comparison_chart(), validate=False)),
+        'rating': ('Quality Rating', pio.to_json(create_rating_chart(), validate=False)),
+    })
 
-    # Run the app
-    def run_app():
-        app.run_server(debug=False, port=port, host='127.0.0.1')
+    dashboard_url = _show_dashboard('flowchart', port)
+    print(f"Research dashboard running at: {dashboard_url}")
+    return dashboard_url
+
+def create_custom_flowchart(title: str = "Custom Flowchart", port: int = 8050) -> str:
+    """
+    Create a custom flowchart for research methodology as a tab of the shared dashboard.
 
-    # Start the server in a separate thread
-    server_thread = threading.Thread(target=run_app)
-    server_thread.daemon = True
-    server_thread.start()
+    Args:
+        title: Flowchart title
+        port: Port to run the dashboard on (ignored if the server is already running)
 
-    # Wait a moment for server to start
-    time.sleep(2)
+    Returns:
+        URL of the dashboard
+    """
 
-    dashboard_url = f"http://127.0.0.1:{port}"
-    webbrowser.open(dashboard_url)
+    tab = f'custom:{title}'
+    _tabs[tab] = (title, pio.to_json(create_custom_flow(title), validate=False))
 
+    dashboard_url = _show_dashboard(tab, port)
     print(f"Custom flowchart running at: {dashboard_url}")
     return dashboard_url
 
+# Static counterparts of the dashboard charts, drawn with matplotlib's Agg backend.
+# They are rendered at their print resolution rather than oversampled.
+_EXPORT_DPI = 150
+
+def _performance_image():
+    data = generate_sample_data('performance')
+    fig = Figure(figsize=(8, 5), dpi=_EXPORT_DPI, layout='tight')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    for key, name, color in _PERFORMANCE_CHART['series']:
+        ax.plot(data['epochs'], data[key], color=color, linewidth=2, label=name)
+    ax.set_title(_PERFORMANCE_CHART['title'])
+    ax.set_xlabel(_PERFORMANCE_CHART['xlabel'])
+    ax.set_ylabel(_PERFORMANCE_CHART['ylabel'])
+    ax.legend()
+    return fig
+
+def _comparison_image():
+    data = generate_sample_data('comparison')
+    fig = Figure(figsize=(8, 5), dpi=_EXPORT_DPI, layout='tight')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+
+    x, bars = _comparison_bars(data)
+    for positions, values, name, color in bars:
+        ax.bar(positions, values, _COMPARISON_CHART['bar_width'], label=name, color=color)
+    ax.set_xticks(x, data['methods'])
+    ax.set_title(_COMPARISON_CHART['title'])
+    ax.set_ylabel(_COMPARISON_CHART['ylabel'])
+    ax.legend()
+    return fig
+
+def _rating_image():
+    data = generate_sample_data('rating')
+    fig = Figure(figsize=(6, 6), dpi=_EXPORT_DPI, layout='tight')
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, projection='polar')
+
+    # close the polygon by repeating the first criterion
+    angles = np.linspace(0, 2 * np.pi, len(data['criteria']), endpoint=False)
+    angles = np.append(angles, angles[0])
+
+    scores = np.append(data['scores'], data['scores'][0])
+    max_scores = np.full_like(angles, data['max_score'])
+
+    score_name, score_color = _RATING_CHART['score']
+    max_name, max_color = _RATING_CHART['reference']
+    ax.plot(angles, scores, color=score_color, label=score_name)
+    ax.fill(angles, scores, color=score_color, alpha=0.25)
+    ax.plot(angles, max_scores, color=max_color, label=max_name)
+    ax.fill(angles, max_scores, color=max_color, alpha=0.3)
+    ax.set_xticks(angles[:-1], data['criteria'])
+    ax.tick_params(axis='x', pad=12)
+    ax.set_ylim(0, data['max_score'])
+    ax.set_title(_RATING_CHART['title'], pad=20)
+    ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.08), ncol=2)
+    return fig
+
 def save_dashboard_plots_as_images(title: str = "Research Dashboard") -> list:
     """
     Save dashboard plots as static images for LaTeX inclusion.
 
+    The images are drawn with matplotlib's Agg backend rather than exported
+    through Kaleido, which would start a headless browser for every render.
+
     Args:
         title: Base title for the plots
 
@@ -359,139 +509,21 @@ def save_dashboard_plots_as_images(title: str = "Research Dashboard") -> list:
         List of saved image file paths
     """
 
-    # Ensure output directory exists
-    output_dir = Path("E:\\nothing\\AutoPaper\\output\\images")
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    saved_files = []
-
-    # Sample data generation
-    def generate_sample_data(chart_type):
-        if chart_type == 'performance':
-            return {
-                'epochs': list(range(1, 101)),
-                'training_loss': np.exp(-np.linspace(0, 3, 100)) + 0.1 * np.random.randn(100),
-                'validation_loss': np.exp(-np.linspace(0, 2.8, 100)) + 0.15 * np.random.randn(100)
-            }
-        elif chart_type == 'comparison':
-            return {
-                'methods': ['Baseline', 'Method A', 'Method B', 'Proposed'],
-                'accuracy': [0.75, 0.82, 0.78, 0.91],
-                'precision': [0.73, 0.80, 0.76, 0.89],
-                'recall': [0.77, 0.84, 0.80, 0.93]
-            }
-        elif chart_type == 'rating':
-            return {
-                'criteria': ['Novelty', 'Technical Quality', 'Clarity', 'Significance', 'Reproducibility'],
-                'scores': [4.2, 4.5, 4.0, 4.3, 3.8],
-                'max_score': 5.0
-            }
-        return {}
-
-    # 1. Save Performance Graph
-    data = generate_sample_data('performance')
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=data['epochs'],
-        y=data['training_loss'],
-        mode='lines',
-        name='Training Loss',
-        line=dict(color='blue', width=2)
-    ))
-    fig.add_trace(go.Scatter(
-        x=data['epochs'],
-        y=data['validation_loss'],
-        mode='lines',
-        name='Validation Loss',
-        line=dict(color='red', width=2)
-    ))
-    fig.update_layout(
-        title="Model Performance Over Time",
-        xaxis_title="Epochs",
-        yaxis_title="Loss",
-        width=800,
-        height=500
-    )
-
-    performance_path = output_dir / "performance_analysis.png"
-    fig.write_image(str(performance_path), width=800, height=500, scale=2)
-    saved_files.append(str(performance_path))
-
-    # 2. Save Comparison Chart
-    data = generate_sample_data('comparison')
-    fig = go.Figure()
-
-    x = np.arange(len(data['methods']))
-    width = 0.25
-
-    fig.add_trace(go.Bar(
-        x=[i - width for i in x],
-        y=data['accuracy'],
-        name='Accuracy',
-        marker_color='lightblue'
-    ))
-    fig.add_trace(go.Bar(
-        x=x,
-        y=data['precision'],
-        name='Precision',
-        marker_color='lightgreen'
-    ))
-    fig.add_trace(go.Bar(
-        x=[i + width for i in x],
-        y=data['recall'],
-        name='Recall',
-        marker_color='lightcoral'
-    ))
-
-    fig.update_layout(
-        title="Method Comparison",
-        xaxis=dict(tickvals=x, ticktext=data['methods']),
-        yaxis_title="Score",
-        barmode='group',
-        width=800,
-        height=500
-    )
-
-    comparison_path = output_dir / "method_comparison.png"
-    fig.write_image(str(comparison_path), width=800, height=500, scale=2)
-    saved_files.append(str(comparison_path))
-
-    # 3. Save Rating Chart
-    data = generate_sample_data('rating')
-    fig = go.Figure()
-
-    fig.add_trace(go.Scatterpolar(
-        r=data['scores'],
-        theta=data['criteria'],
-        fill='toself',
-        name='Current Paper',
-        line_color='blue'
-    ))
-
-    fig.add_trace(go.Scatterpolar(
-        r=[data['max_score']] * len(data['criteria']),
-        theta=data['criteria'],
-        fill='toself',
-        name='Maximum Score',
-        line_color='lightgray',
-        opacity=0.3
-    ))
-
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, data['max_score']]
-            )
-        ),
-        title="Paper Quality Rating",
-        width=600,
-        height=600
-    )
-
-    rating_path = output_dir / "quality_rating.png"
-    fig.write_image(str(rating_path), width=600, height=600, scale=2)
-    saved_files.append(str(rating_path))
+    # (figure, path) for every image; figures are built first, then written in parallel
+    tasks = [
+        (_performance_image(), IMAGES_DIR / "performance_analysis.png"),
+        (_comparison_image(), IMAGES_DIR / "method_comparison.png"),
+        (_rating_image(), IMAGES_DIR / "quality_rating.png"),
+    ]
+
+    # Figures are independent, so their rendering and PNG encoding can run side by side
+    def write_image(task):
+        fig, path = task
+        fig.savefig(path)
+        return str(path)
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        saved_files = list(executor.map(write_image, tasks))
 
     print(f"Saved {len(saved_files)} dashboard plots as images:")
     for file_path in saved_files:
@@ -1,5 +1,8 @@
 from datetime import datetime
 from pathlib import Path
+from typing_extensions import TypedDict
+from image_tools import create_research_plot
+import asyncio
 import subprocess
 
 def render_latex_pdf(latex_content: str) -> str:
@@ -53,3 +56,25 @@ def render_latex_pdf(latex_content: str) -> str:
         raise
 
 
+class PlotSpec(TypedDict):
+    data_type: str
+    title: str
+    filename: str
+
+async def render_all(plot_specs: list[PlotSpec], latex_content: str) -> dict:
+    """
+    Create all research plots for a paper concurrently, then render the LaTeX document to PDF.
+
+    Args:
+        plot_specs: Plots to create, each with data_type ('comparison', 'performance', 'distribution', 'timeline'), title and filename (without extension)
+        latex_content: The LaTeX document content as a string, referencing the plots as images/<filename>.png
+
+    Returns:
+        Paths to the saved plot files and to the generated PDF document
+    """
+    # plotting and pdflatex both block, so run them in worker threads
+    plot_paths = await asyncio.gather(
+        *(asyncio.to_thread(create_research_plot, **spec) for spec in plot_specs)
+    )
+    pdf_path = await asyncio.to_thread(render_latex_pdf, latex_content)
+    return {"plots": list(plot_paths), "pdf": pdf_path}